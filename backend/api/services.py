@@ -60,8 +60,10 @@ class DatasetService:
         if std == 0 or np.isnan(std):
             return np.zeros(len(values), dtype=bool)
         
-        z_scores = np.abs((values - mean) / std)
-        return z_scores > threshold
+        # |x - mean| / std > t  <=>  |x - mean| > t * std, which skips a full
+        # division pass over the column
+        deviations = np.abs(values - mean)
+        return deviations > threshold * std
     
     @staticmethod
     @transaction.atomic
@@ -80,18 +82,30 @@ class DatasetService:
         pressure_outliers = DatasetService.detect_outliers(df['Pressure'].values)
         temperature_outliers = DatasetService.detect_outliers(df['Temperature'].values)
         
+        # Columns are pulled out as plain lists and zipped positionally; iterrows()
+        # would build a Series per row, and its index labels no longer line up
+        # with the outlier arrays once dropna() has removed rows.
         equipment_objects = [
             Equipment(
                 dataset=dataset,
-                equipment_name=row['Equipment Name'],
-                equipment_type=row['Type'],
-                flowrate=row['Flowrate'],
-                pressure=row['Pressure'],
-                temperature=row['Temperature'],
-                is_pressure_outlier=bool(pressure_outliers[idx]),
-                is_temperature_outlier=bool(temperature_outliers[idx]),
+                equipment_name=name,
+                equipment_type=equipment_type,
+                flowrate=flowrate,
+                pressure=pressure,
+                temperature=temperature,
+                is_pressure_outlier=pressure_outlier,
+                is_temperature_outlier=temperature_outlier,
+            )
+            for name, equipment_type, flowrate, pressure, temperature, pressure_outlier, temperature_outlier
+            in zip(
+                df['Equipment Name'].tolist(),
+                df['Type'].tolist(),
+                df['Flowrate'].tolist(),
+                df['Pressure'].tolist(),
+                df['Temperature'].tolist(),
+                pressure_outliers.tolist(),
+                temperature_outliers.tolist(),
             )
-            for idx, row in df.iterrows()
         ]
         
         Equipment.objects.bulk_create(equipment_objects, batch_size=DatasetService.CHUNK_SIZE)
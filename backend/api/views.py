@@ -59,6 +59,29 @@ class DatasetViewSet(viewsets.ReadOnlyModelViewSet):
                 {'error': 'Internal server error'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+    
+    @action(detail=True, methods=['get'])
+    def bundle(self, request, pk=None):
+        """Get analytics and equipment for a dataset in one response."""
+        try:
+            analytics_data = DatasetService.get_analytics(pk)
+            equipment = Equipment.objects.filter(dataset_id=pk)
+            return Response({
+                'analytics': AnalyticsSerializer(analytics_data).data,
+                'equipment': EquipmentSerializer(equipment, many=True).data,
+            })
+        except ValueError as e:
+            logger.warning(f"Bundle request failed: {e}")
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error in bundle: {e}", exc_info=True)
+            return Response(
+                {'error': 'Internal server error'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
 
 
 class CSVUploadView(APIView):
@@ -190,6 +213,8 @@ def download_dataset_pdf(request, dataset_id):
             as_attachment=True,
             filename=filename
         )
+        # PDFs are already compressed; an explicit encoding makes GZipMiddleware skip them
+        response['Content-Encoding'] = 'identity'
         
         logger.info(f"PDF generated for dataset {dataset_id} by user {request.user.username}")
         return response
@@ -1,8 +1,49 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QLineEdit, 
                              QPushButton, QMessageBox, QFrame, QGraphicsDropShadowEffect)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QColor, QFont
 
+# One stylesheet for the whole window, parsed once; widgets opt in by objectName
+_LOGIN_QSS = """
+#loginWindow { background-color: #F8FAFC; }
+#loginCard { background-color: white; border-radius: 12px; border: 1px solid #E2E8F0; }
+#loginTitle { font-size: 24px; font-weight: bold; color: #1E293B; }
+#loginSubtitle { font-size: 13px; color: #64748B; margin-bottom: 10px; }
+
+#loginCard QLineEdit {
+    border: 1px solid #CBD5E1; border-radius: 6px; padding-left: 12px;
+    font-size: 13px; color: #334155; background: #FFFFFF;
+}
+#loginCard QLineEdit:focus { border: 2px solid #3B82F6; }
+
+#loginButton {
+    background-color: #1E3A8A; color: white; font-weight: bold;
+    font-size: 14px; border-radius: 6px; border: none;
+}
+#loginButton:hover { background-color: #1E40AF; }
+#loginButton:pressed { background-color: #172554; }
+
+#demoHint {
+    color: #64748B; font-size: 12px; font-weight: bold; background: #F1F5F9;
+    border: 1px solid #E2E8F0; border-radius: 4px; padding: 5px;
+}
+#loginFooter { color: #94A3B8; font-size: 11px; margin-top: 5px; }
+"""
+
+class LoginWorker(QThread):
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)  # Unexpected failure, as opposed to a rejected login
+    def __init__(self, api_client, username, password):
+        super().__init__()
+        self.api_client, self.username, self.password = api_client, username, password
+    def run(self):
+        try:
+            res = self.api_client.login(self.username, self.password)
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        self.finished.emit(res)
+
 class LoginWindow(QWidget):
     login_successful = pyqtSignal(str, str)  # username, token
 
@@ -14,7 +55,9 @@ class LoginWindow(QWidget):
     def init_ui(self):
         self.setWindowTitle("Login - CEPV System")
         self.resize(1000, 700)
-        self.setStyleSheet("background-color: #F8FAFC;")  # Slate-50 background
+        self.setObjectName("loginWindow")
+        self.setAttribute(Qt.WA_StyledBackground)  # Lets the #loginWindow background paint
+        self.setStyleSheet(_LOGIN_QSS)
 
         # Center Layout
         main_layout = QVBoxLayout(self)
@@ -22,14 +65,8 @@ class LoginWindow(QWidget):
 
         # --- LOGIN CARD ---
         card = QFrame()
+        card.setObjectName("loginCard")
         card.setFixedSize(400, 500) # Height adjusted for demo hint
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 12px;
-                border: 1px solid #E2E8F0;
-            }
-        """)
         
         # Shadow Effect
         shadow = QGraphicsDropShadowEffect()
@@ -45,12 +82,12 @@ class LoginWindow(QWidget):
         # 1. Header
         title = QLabel("Welcome Back")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("font-size: 24px; font-weight: bold; color: #1E293B; border: none;")
+        title.setObjectName("loginTitle")
         
         subtitle = QLabel("Enter your credentials to access the chemical analytics platform.")
         subtitle.setAlignment(Qt.AlignCenter)
         subtitle.setWordWrap(True)
-        subtitle.setStyleSheet("font-size: 13px; color: #64748B; margin-bottom: 10px; border: none;")
+        subtitle.setObjectName("loginSubtitle")
 
         card_layout.addWidget(title)
         card_layout.addWidget(subtitle)
@@ -60,14 +97,12 @@ class LoginWindow(QWidget):
         self.username_input.setPlaceholderText("Username")
         self.username_input.setText("testuser") 
         self.username_input.setFixedHeight(45)
-        self.username_input.setStyleSheet(self.input_style())
 
         self.password_input = QLineEdit()
         self.password_input.setPlaceholderText("Password")
         self.password_input.setText("testpass123")
         self.password_input.setEchoMode(QLineEdit.Password)
         self.password_input.setFixedHeight(45)
-        self.password_input.setStyleSheet(self.input_style())
 
         card_layout.addWidget(self.username_input)
         card_layout.addWidget(self.password_input)
@@ -76,54 +111,24 @@ class LoginWindow(QWidget):
         self.login_btn = QPushButton("Sign In")
         self.login_btn.setFixedHeight(45)
         self.login_btn.setCursor(Qt.PointingHandCursor)
+        self.login_btn.setObjectName("loginButton")
         self.login_btn.clicked.connect(self.handle_login)
-        self.login_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1E3A8A; 
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-                border-radius: 6px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #1E40AF;
-            }
-            QPushButton:pressed {
-                background-color: #172554;
-            }
-        """)
         card_layout.addWidget(self.login_btn)
 
         # 4. Demo Hint (Visible Reference)
         demo_hint = QLabel("Demo: testuser / testpass123")
         demo_hint.setAlignment(Qt.AlignCenter)
-        demo_hint.setStyleSheet("color: #64748B; font-size: 12px; font-weight: bold; background: #F1F5F9; border-radius: 4px; padding: 5px;")
+        demo_hint.setObjectName("demoHint")
         card_layout.addWidget(demo_hint)
 
         # 5. Footer
         footer = QLabel("Chemical Equipment Parameter Visualizer v2.0")
         footer.setAlignment(Qt.AlignCenter)
-        footer.setStyleSheet("color: #94A3B8; font-size: 11px; margin-top: 5px; border: none;")
+        footer.setObjectName("loginFooter")
         card_layout.addWidget(footer)
 
         main_layout.addWidget(card)
 
-    def input_style(self):
-        return """
-            QLineEdit {
-                border: 1px solid #CBD5E1;
-                border-radius: 6px;
-                padding-left: 12px;
-                font-size: 13px;
-                color: #334155;
-                background: #FFFFFF;
-            }
-            QLineEdit:focus {
-                border: 2px solid #3B82F6;
-            }
-        """
-
     def handle_login(self):
         username = self.username_input.text()
         password = self.password_input.text()
@@ -132,19 +137,28 @@ class LoginWindow(QWidget):
             QMessageBox.warning(self, "Error", "Please enter both username and password")
             return
 
+        # The token request runs off the GUI thread so the window keeps painting
         self.login_btn.setText("Authenticating...")
         self.login_btn.setEnabled(False)
-        
-        try:
-            res = self.api_client.login(username, password)
-            if res["success"]:
-                # FIXED: Correct path to the token in the response dictionary
-                token = res["data"]["access"] 
-                self.login_successful.emit(username, token)
-            else:
-                QMessageBox.critical(self, "Login Failed", res.get("error", "Invalid credentials"))
-        except Exception as e:
-            QMessageBox.critical(self, "System Error", f"An error occurred during login.\n{str(e)}")
-        finally:
-            self.login_btn.setText("Sign In")
-            self.login_btn.setEnabled(True)
\ No newline at end of file
+        self.login_worker = LoginWorker(self.api_client, username, password)
+        self.login_worker.finished.connect(self.on_login_finished)
+        self.login_worker.error.connect(self.on_login_error)
+        self.login_worker.start()
+
+    def reset_login_button(self):
+        self.login_worker.wait()  # run() has returned; the window may be dropped on success
+        self.login_btn.setText("Sign In")
+        self.login_btn.setEnabled(True)
+
+    def on_login_finished(self, res):
+        self.reset_login_button()
+        if res["success"]:
+            # FIXED: Correct path to the token in the response dictionary
+            token = res["data"]["access"] 
+            self.login_successful.emit(self.login_worker.username, token)
+        else:
+            QMessageBox.critical(self, "Login Failed", res.get("error", "Invalid credentials"))
+
+    def on_login_error(self, message):
+        self.reset_login_button()
+        QMessageBox.critical(self, "System Error", f"An error occurred during login.\n{message}")
\ No newline at end of file
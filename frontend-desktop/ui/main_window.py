@@ -5,6 +5,38 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize
 from PyQt5.QtGui import QColor, QCursor
 
+# One stylesheet for the whole window, parsed once; widgets opt in by objectName
+_MAIN_QSS = """
+#mainCentral, #mainContent { background-color: #F3F4F6; }
+#mainHeader { background-color: #1E3A8A; }
+#appTitle { color: white; font-size: 20px; font-weight: bold; }
+#userInfo { color: white; margin-right: 15px; }
+#pageTitle { font-size: 28px; font-weight: bold; color: #1F2937; }
+#mainScroll { border: none; }
+
+#logoutButton, #uploadButton, #viewButton, #pdfButton {
+    color: white; border-radius: 6px; font-weight: bold; border: none;
+}
+#logoutButton { background: #DC2626; padding: 6px 16px; }
+#logoutButton:hover { background: #B91C1C; }
+#uploadButton, #viewButton { background: #1E3A8A; }
+#uploadButton:hover, #viewButton:hover { background: #1E40AF; }
+#uploadButton:disabled { background: #64748B; }
+#viewButton, #pdfButton { padding: 6px; }
+#pdfButton { background: #10B981; }
+#pdfButton:hover { background: #059669; }
+
+#datasetCard { background-color: white; border: 1px solid #E5E7EB; border-radius: 12px; }
+#datasetCard:hover { border: 1px solid #3B82F6; }
+#cardIcon { font-size: 24px; }
+#cardName { font-weight: bold; font-size: 14px; color: #1F2937; }
+#cardDate { color: #6B7280; font-size: 12px; margin-bottom: 10px; }
+#cardCount {
+    background: #EFF6FF; color: #1E40AF; border-radius: 4px;
+    padding: 4px; font-size: 11px; font-weight: bold;
+}
+"""
+
 # --- WORKER THREADS (Keep existing logic) ---
 class PDFWorker(QThread):
     finished = pyqtSignal(bool, str)
@@ -15,6 +47,14 @@ class PDFWorker(QThread):
         res = self.api_client.download_pdf(self.d_id, self.path)
         self.finished.emit(res["success"], res.get("error", "Success"))
 
+class UploadWorker(QThread):
+    finished = pyqtSignal(dict)
+    def __init__(self, api_client, path):
+        super().__init__()
+        self.api_client, self.path = api_client, path
+    def run(self):
+        self.finished.emit(self.api_client.upload_csv(self.path))
+
 class DataLoadThread(QThread):
     finished = pyqtSignal(dict)
     def __init__(self, api_client):
@@ -26,16 +66,7 @@ class DataLoadThread(QThread):
 class DatasetCardWidget(QFrame):
     def __init__(self, dataset, on_view, on_pdf):
         super().__init__()
-        self.setStyleSheet("""
-            DatasetCardWidget {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 12px;
-            }
-            DatasetCardWidget:hover {
-                border: 1px solid #3B82F6;
-            }
-        """)
+        self.setObjectName("datasetCard")
         self.setFixedSize(320, 200)
         
         layout = QVBoxLayout(self)
@@ -44,9 +75,9 @@ class DatasetCardWidget(QFrame):
         # Header (Icon + Filename)
         h_layout = QHBoxLayout()
         icon = QLabel("📊")
-        icon.setStyleSheet("font-size: 24px; border: none;")
+        icon.setObjectName("cardIcon")
         name = QLabel(dataset.get('filename', 'Unknown'))
-        name.setStyleSheet("font-weight: bold; font-size: 14px; color: #1F2937; border: none;")
+        name.setObjectName("cardName")
         name.setWordWrap(True)
         h_layout.addWidget(icon)
         h_layout.addWidget(name, 1)
@@ -54,13 +85,13 @@ class DatasetCardWidget(QFrame):
         
         # Date
         date_lbl = QLabel(f"Uploaded: {dataset.get('uploaded_at', '')[:10]}")
-        date_lbl.setStyleSheet("color: #6B7280; font-size: 12px; border: none; margin-bottom: 10px;")
+        date_lbl.setObjectName("cardDate")
         layout.addWidget(date_lbl)
         
         # Stats Row
         stats_layout = QHBoxLayout()
         count_bg = QLabel(f" {dataset.get('total_equipment', 0)} Units ")
-        count_bg.setStyleSheet("background: #EFF6FF; color: #1E40AF; border-radius: 4px; padding: 4px; font-size: 11px; font-weight: bold; border: none;")
+        count_bg.setObjectName("cardCount")
         stats_layout.addWidget(count_bg)
         stats_layout.addStretch()
         layout.addLayout(stats_layout)
@@ -71,19 +102,13 @@ class DatasetCardWidget(QFrame):
         btn_layout = QHBoxLayout()
         btn_view = QPushButton("View Analysis")
         btn_view.setCursor(Qt.PointingHandCursor)
-        btn_view.setStyleSheet("""
-            QPushButton { background: #1E3A8A; color: white; border-radius: 6px; padding: 6px; font-weight: bold; border: none; }
-            QPushButton:hover { background: #1E40AF; }
-        """)
+        btn_view.setObjectName("viewButton")
         btn_view.clicked.connect(lambda: on_view(dataset))
         
         btn_pdf = QPushButton("PDF")
         btn_pdf.setFixedWidth(50)
         btn_pdf.setCursor(Qt.PointingHandCursor)
-        btn_pdf.setStyleSheet("""
-            QPushButton { background: #10B981; color: white; border-radius: 6px; padding: 6px; font-weight: bold; border: none; }
-            QPushButton:hover { background: #059669; }
-        """)
+        btn_pdf.setObjectName("pdfButton")
         btn_pdf.clicked.connect(lambda: on_pdf(dataset))
         
         btn_layout.addWidget(btn_view)
@@ -96,16 +121,18 @@ class MainWindow(QMainWindow):
     def __init__(self, api_client, username):
         super().__init__()
         self.api_client, self.username = api_client, username
-        self.detail_windows = []
+        self.detail_windows = {}  # dataset id -> open DatasetDetailWindow
+        self.dataset_ids = []  # grid order, for prefetching a dataset's neighbours
         self.init_ui()
         self.load_datasets()
         
     def init_ui(self):
         self.setWindowTitle("Chemical Equipment Parameter Visualizer")
         self.resize(1280, 900)
-        self.setStyleSheet("background-color: #F3F4F6;") # bg-gray-100
+        self.setStyleSheet(_MAIN_QSS)
         
         central = QWidget()
+        central.setObjectName("mainCentral")
         self.setCentralWidget(central)
         main_layout = QVBoxLayout(central)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -113,23 +140,20 @@ class MainWindow(QMainWindow):
         
         # --- HEADER (Matches Dashboard.jsx Header) ---
         header = QFrame()
-        header.setStyleSheet("background-color: #1E3A8A;") # Primary Blue
+        header.setObjectName("mainHeader")
         header.setFixedHeight(70)
         h_layout = QHBoxLayout(header)
         h_layout.setContentsMargins(24, 0, 24, 0)
         
         title = QLabel("Chemical Equipment Parameter Visualizer")
-        title.setStyleSheet("color: white; font-size: 20px; font-weight: bold; border: none;")
+        title.setObjectName("appTitle")
         
         user_info = QLabel(f"Welcome, {self.username}")
-        user_info.setStyleSheet("color: white; margin-right: 15px; border: none;")
+        user_info.setObjectName("userInfo")
         
         btn_logout = QPushButton("Logout")
         btn_logout.setCursor(Qt.PointingHandCursor)
-        btn_logout.setStyleSheet("""
-            QPushButton { background: #DC2626; color: white; padding: 6px 16px; border-radius: 6px; font-weight: bold; border: none; }
-            QPushButton:hover { background: #B91C1C; }
-        """)
+        btn_logout.setObjectName("logoutButton")
         btn_logout.clicked.connect(self.handle_logout)
         
         h_layout.addWidget(title)
@@ -141,29 +165,28 @@ class MainWindow(QMainWindow):
         # --- SCROLLABLE CONTENT ---
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; }")
+        scroll.setObjectName("mainScroll")
         
         content_widget = QWidget()
+        content_widget.setObjectName("mainContent")
+        self.content_widget = content_widget
         self.content_layout = QVBoxLayout(content_widget)
         self.content_layout.setContentsMargins(32, 32, 32, 32)
         
         # Page Title Row
         title_row = QHBoxLayout()
         pg_title = QLabel("Datasets")
-        pg_title.setStyleSheet("font-size: 28px; font-weight: bold; color: #1F2937; border: none;")
+        pg_title.setObjectName("pageTitle")
         
-        btn_upload = QPushButton("Upload CSV")
-        btn_upload.setCursor(Qt.PointingHandCursor)
-        btn_upload.setFixedSize(120, 40)
-        btn_upload.setStyleSheet("""
-            QPushButton { background: #1E3A8A; color: white; border-radius: 6px; font-weight: bold; border: none; }
-            QPushButton:hover { background: #1E40AF; }
-        """)
-        btn_upload.clicked.connect(self.handle_upload)
+        self.btn_upload = QPushButton("Upload CSV")
+        self.btn_upload.setCursor(Qt.PointingHandCursor)
+        self.btn_upload.setFixedSize(120, 40)
+        self.btn_upload.setObjectName("uploadButton")
+        self.btn_upload.clicked.connect(self.handle_upload)
         
         title_row.addWidget(pg_title)
         title_row.addStretch()
-        title_row.addWidget(btn_upload)
+        title_row.addWidget(self.btn_upload)
         self.content_layout.addLayout(title_row)
         self.content_layout.addSpacing(20)
         
@@ -182,36 +205,70 @@ class MainWindow(QMainWindow):
         self.thread.start()
 
     def populate_grid(self, res):
-        # Clear grid
-        for i in reversed(range(self.grid_layout.count())): 
-            self.grid_layout.itemAt(i).widget().setParent(None)
-            
-        if res["success"]:
-            datasets = res["data"]
-            cols = 3
-            for idx, d in enumerate(datasets):
-                card = DatasetCardWidget(d, self.view_details, self.download_pdf)
-                self.grid_layout.addWidget(card, idx // cols, idx % cols)
-        else:
-            # Show Error placeholder
-            err = QLabel("Failed to load datasets")
-            self.grid_layout.addWidget(err, 0, 0)
+        # Swap the cards with painting suspended, so the grid lays out and
+        # repaints once instead of once per card
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            # Clear grid
+            for i in reversed(range(self.grid_layout.count())): 
+                w = self.grid_layout.takeAt(i).widget()
+                w.hide()
+                w.deleteLater()
+                
+            if res["success"]:
+                datasets = res["data"]
+                self.dataset_ids = [d["id"] for d in datasets]
+                cols = 3
+                for idx, d in enumerate(datasets):
+                    card = DatasetCardWidget(d, self.view_details, self.download_pdf)
+                    self.grid_layout.addWidget(card, idx // cols, idx % cols)
+            else:
+                # Show Error placeholder
+                err = QLabel("Failed to load datasets")
+                self.grid_layout.addWidget(err, 0, 0)
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
 
     def handle_upload(self):
         f, _ = QFileDialog.getOpenFileName(self, "Upload CSV", "", "CSV (*.csv)")
         if f:
-            res = self.api_client.upload_csv(f)
-            if res["success"]: 
-                self.load_datasets()
-            else:
-                QMessageBox.warning(self, "Upload Failed", res.get("error", "Unknown error"))
+            # The upload streams off the GUI thread; the button is locked until it lands
+            self.btn_upload.setEnabled(False)
+            self.btn_upload.setText("Uploading...")
+            self.upload_worker = UploadWorker(self.api_client, f)
+            self.upload_worker.finished.connect(self.on_upload_finished)
+            self.upload_worker.start()
+
+    def on_upload_finished(self, res):
+        self.btn_upload.setEnabled(True)
+        self.btn_upload.setText("Upload CSV")
+        if res["success"]: 
+            self.load_datasets()
+        else:
+            QMessageBox.warning(self, "Upload Failed", res.get("error", "Unknown error"))
 
     def view_details(self, d):
         from widgets.detail_widget import DatasetDetailWindow
-        # Pass style matching window
-        win = DatasetDetailWindow(self.api_client, d, self)
-        self.detail_windows.append(win)
+        # An already open window for this dataset is brought forward, not rebuilt
+        win = self.detail_windows.get(d['id'])
+        if win is None:
+            win = DatasetDetailWindow(self.api_client, d, self)
+            win.closed.connect(lambda did: self.detail_windows.pop(did, None))
+            win.bundle_loaded.connect(self.prefetch_neighbours)
+            self.detail_windows[d['id']] = win
         win.show()
+        win.raise_()
+        win.activateWindow()
+
+    def prefetch_neighbours(self, dataset_id):
+        # The cards next to the one just opened are the likeliest next picks;
+        # their bundles are fetched once this window's own load has landed
+        if dataset_id not in self.dataset_ids:
+            return
+        idx = self.dataset_ids.index(dataset_id)
+        self.api_client.prefetch_detail_bundles(
+            [self.dataset_ids[i] for i in (idx + 1, idx - 1) if 0 <= i < len(self.dataset_ids)]
+        )
 
     def download_pdf(self, d):
         p, _ = QFileDialog.getSaveFileName(self, "Save PDF", f"report_{d['filename'][:-4]}.pdf", "PDF (*.pdf)")
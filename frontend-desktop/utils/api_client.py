@@ -1,18 +1,64 @@
 import requests
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 import json
 import logging
+import os
+import socket
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+class TunedAdapter(HTTPAdapter):
+    """HTTPAdapter with latency-oriented socket options on every pooled connection."""
+    
+    SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),  # No Nagle delay on small requests
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        (socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20),
+        (socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20),
+    ]
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
 class APIClient:
     """Client for communicating with Django backend API."""
     
+    # Detail bundles are reused for quick re-opens of the same dataset
+    BUNDLE_CACHE_SIZE = 32
+    BUNDLE_CACHE_TTL = 30.0  # seconds
+    
     def __init__(self, base_url: str = "http://127.0.0.1:8100/api"):
         self.base_url = base_url
         self.access_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
+        # Pagination is configured server-wide; detected from the first list response
+        self._paginated: Optional[bool] = None
+        # Whether the server has the one-request detail bundle endpoint; probed on first use
+        self._bundle_endpoint: Optional[bool] = None
         self.session = requests.Session()
+        # Analytics/equipment JSON is highly repetitive; the backend gzips it
+        # (GZipMiddleware) and urllib3 decodes it once in C.
+        self.session.headers["Accept-Encoding"] = "gzip, deflate"
+        
+        # Single backend host; the detail window issues its requests concurrently,
+        # so keep a few warm keep-alive connections instead of re-handshaking.
+        adapter = TunedAdapter(pool_connections=1, pool_maxsize=4)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Shared by concurrent fetches, so opening a window does not spin up threads
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="api")
+        # Background cache warming runs one bundle at a time, beside the pool above
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="api-prefetch")
+        # dataset id -> (expiry on the monotonic clock, bundle); filled from worker threads
+        self._bundle_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bundle_lock = threading.Lock()
     
     def login(self, username: str, password: str) -> Dict[str, Any]:
         """Authenticate user and store tokens."""
@@ -35,6 +81,7 @@ class APIClient:
         """Clear stored authentication tokens."""
         self.access_token = None
         self.refresh_token = None
+        self.clear_cache()  # Cached bundles belong to the previous user
         # Tokens are stored in memory, not localStorage in desktop app
         logger.info("User logged out, tokens cleared")
     
@@ -45,6 +92,12 @@ class APIClient:
             headers["Authorization"] = f"Bearer {self.access_token}"
         return headers
     
+    def _unwrap_list(self, data: Any) -> Any:
+        """Strip the paginated envelope from a list response."""
+        if self._paginated is None:
+            self._paginated = isinstance(data, dict) and "results" in data
+        return data["results"] if self._paginated else data
+    
     def get_datasets(self) -> Dict[str, Any]:
         """Get all datasets."""
         try:
@@ -53,11 +106,7 @@ class APIClient:
                 headers=self._get_headers()
             )
             response.raise_for_status()
-            data = response.json()
-            
-            # Handle paginated response
-            datasets = data.get("results", data) if isinstance(data, dict) else data
-            return {"success": True, "data": datasets}
+            return {"success": True, "data": self._unwrap_list(response.json())}
         except requests.exceptions.RequestException as e:
             return {"success": False, "error": str(e)}
     
@@ -86,7 +135,7 @@ class APIClient:
             return {"success": False, "error": str(e)}
     
     def get_equipment(self, dataset_id: str) -> Dict[str, Any]:
-        """Get equipment for a dataset."""
+        """Get all equipment for a dataset, following pagination to the last page."""
         try:
             response = self.session.get(
                 f"{self.base_url}/equipment/",
@@ -95,25 +144,109 @@ class APIClient:
             )
             response.raise_for_status()
             data = response.json()
-            
-            # Handle paginated response
-            equipment = data.get("results", data) if isinstance(data, dict) else data
+            equipment = self._unwrap_list(data)
+            # Every page is read, so this matches the unpaginated bundle endpoint
+            while self._paginated and data.get("next"):
+                response = self.session.get(data["next"], headers=self._get_headers())
+                response.raise_for_status()
+                data = response.json()
+                equipment.extend(data["results"])
             return {"success": True, "data": equipment}
         except requests.exceptions.RequestException as e:
             return {"success": False, "error": str(e)}
     
+    def get_dataset_bundle(self, dataset_id: str) -> Dict[str, Any]:
+        """Get analytics and equipment for a dataset in one request."""
+        try:
+            response = self.session.get(
+                f"{self.base_url}/datasets/{dataset_id}/bundle/",
+                headers=self._get_headers()
+            )
+            response.raise_for_status()
+            return {"success": True, "data": response.json()}
+        except requests.exceptions.RequestException as e:
+            # The status tells a server without the endpoint from a failed request
+            status_code = e.response.status_code if e.response is not None else None
+            return {"success": False, "error": str(e), "status": status_code}
+    
+    def clear_cache(self):
+        """Drop all cached detail bundles."""
+        with self._bundle_lock:
+            self._bundle_cache.clear()
+    
+    def fetch_detail_bundle(self, dataset_id: str) -> Dict[str, Any]:
+        """Fetch analytics and equipment for a dataset, reusing a recent result."""
+        now = time.monotonic()
+        with self._bundle_lock:
+            cached = self._bundle_cache.get(dataset_id)
+            if cached is not None and cached[0] > now:
+                self._bundle_cache.move_to_end(dataset_id)
+                return cached[1]
+        
+        res = self._fetch_detail_bundle(dataset_id)
+        if res["success"]:
+            with self._bundle_lock:
+                self._bundle_cache[dataset_id] = (now + self.BUNDLE_CACHE_TTL, res)
+                self._bundle_cache.move_to_end(dataset_id)
+                while len(self._bundle_cache) > self.BUNDLE_CACHE_SIZE:
+                    self._bundle_cache.popitem(last=False)
+        return res
+    
+    def prefetch_detail_bundles(self, dataset_ids):
+        """Warm the bundle cache for datasets likely to be opened next, in the background."""
+        for dataset_id in dataset_ids:
+            self._prefetch_pool.submit(self.fetch_detail_bundle, dataset_id)
+    
+    def _fetch_detail_bundle(self, dataset_id: str) -> Dict[str, Any]:
+        """Fetch analytics and equipment for a dataset, in one request where the server allows."""
+        missing = False
+        if self._bundle_endpoint is not False:
+            res = self.get_dataset_bundle(dataset_id)
+            if res["success"]:
+                self._bundle_endpoint = True
+                return res
+            if self._bundle_endpoint:
+                return res  # The endpoint exists, so this is a real failure
+            missing = res.get("status") in (404, 405)
+        
+        res = self._fetch_detail_pair(dataset_id)
+        # Only a 404/405 for the bundle of a dataset the pair can load marks an
+        # older server; any other failure leaves the endpoint to be probed again
+        if res["success"] and missing:
+            self._bundle_endpoint = False
+        return res
+    
+    def _fetch_detail_pair(self, dataset_id: str) -> Dict[str, Any]:
+        """Fetch analytics and equipment for a dataset concurrently."""
+        # Equipment is fetched on the calling (worker) thread while analytics
+        # runs on the shared pool; wall time is the slower of the two.
+        analytics = self._pool.submit(self.get_analytics, dataset_id)
+        res_e = self.get_equipment(dataset_id)
+        if not res_e["success"]:
+            # The bundle is unusable either way; drop the analytics request if
+            # it is still queued behind another window's fetch
+            analytics.cancel()
+            return {"success": False, "error": res_e.get("error")}
+        res_a = analytics.result()
+        
+        if not res_a["success"]:
+            return {"success": False, "error": res_a.get("error")}
+        return {"success": True, "data": {"analytics": res_a["data"], "equipment": res_e["data"]}}
+    
     def upload_csv(self, file_path: str) -> Dict[str, Any]:
-        """Upload CSV file."""
+        """Upload CSV file (streamed, never fully buffered in memory)."""
         try:
             with open(file_path, 'rb') as f:
-                files = {'file': f}
-                headers = {}
+                encoder = MultipartEncoder(
+                    fields={'file': (os.path.basename(file_path), f, 'text/csv')}
+                )
+                headers = {"Content-Type": encoder.content_type}
                 if self.access_token:
                     headers["Authorization"] = f"Bearer {self.access_token}"
                 
                 response = self.session.post(
                     f"{self.base_url}/upload/",
-                    files=files,
+                    data=encoder,
                     headers=headers
                 )
                 response.raise_for_status()
@@ -123,6 +256,7 @@ class APIClient:
     
     def download_pdf(self, dataset_id: str, save_path: str) -> Dict[str, Any]:
         """Download PDF report."""
+        opened = False
         try:
             response = self.session.get(
                 f"{self.base_url}/datasets/{dataset_id}/pdf/",
@@ -131,10 +265,17 @@ class APIClient:
             )
             response.raise_for_status()
             
+            # iter_content wraps dropped connections and bad encodings in RequestException
             with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                opened = True
+                for chunk in response.iter_content(chunk_size=1 << 20):
                     f.write(chunk)
             
             return {"success": True, "path": save_path}
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, OSError) as e:
+            if opened:
+                try:
+                    os.remove(save_path)  # Don't leave a truncated report behind
+                except OSError:
+                    pass
             return {"success": False, "error": str(e)}
\ No newline at end of file
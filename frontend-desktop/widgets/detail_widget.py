@@ -1,42 +1,645 @@
+import functools
 import logging
+import operator
+import threading
+from collections import OrderedDict, namedtuple
+from types import MappingProxyType
 import numpy as np
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QTableWidget, QTableWidgetItem, QPushButton, QFrame,
+                             QTableView, QPushButton, QFrame, QApplication, QStyle,
                              QScrollArea, QHeaderView, QButtonGroup, QComboBox, QSizePolicy,
-                             QGraphicsDropShadowEffect)
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor, QFont
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+                             QGraphicsDropShadowEffect, QStyledItemDelegate, QStyleOptionViewItem,
+                             QStackedWidget, QListView, QAbstractItemView)
+from PyQt5.QtCore import (Qt, QThread, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex, QRect, QRectF, QSize,
+                          QStringListModel, QRunnable, QThreadPool)
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QPainter, QImage, QPixmap, QPalette
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
-import matplotlib.patches as patches
 
 logger = logging.getLogger(__name__)
 
+# Status badge (text, colour) pairs shared by every table row
+_STATUS_ALERT = ("⚠️ ALERT", "#EF4444")
+_STATUS_OK = ("OK", "#10B981")
+
+# Window palette per theme (keyed by is_dark_mode)
+_THEMES = {
+    False: dict(bg_main="#F8FAFC", bg_card="#FFFFFF", text_main="#1E293B", text_sub="#64748B",
+                border="#E2E8F0", header_bg="#F8FAFC", pill_bg="#3B82F6", pill_fg="white",
+                alert_bg="#FEF2F2", alert_name="#991B1B", alert_desc="#B91C1C", cell_bg="#F1F5F9"),
+    True: dict(bg_main="#0F172A", bg_card="#1E293B", text_main="#F8FAFC", text_sub="#94A3B8",
+               border="#334155", header_bg="#0F172A", pill_bg="#60A5FA", pill_fg="#0F172A",
+               alert_bg="#450a0a", alert_name="#F87171", alert_desc="#FECACA", cell_bg="#1E293B"),
+}
+
+# One stylesheet for the whole window, applied with a single setStyleSheet per
+# theme change; widgets are targeted by objectName / dynamic property
+_DETAIL_QSS = """
+#detailCentral {{ background-color: {bg_main}; }}
+#detailHeader, #detailKpis {{ background: {bg_card}; border: none; border-bottom: 1px solid {border}; }}
+#detailTitle {{ font-size: 18px; font-weight: 900; color: {text_main}; }}
+#filterLabel {{ font-weight: 700; color: #94A3B8; font-size: 11px; }}
+#detailHeader QComboBox {{ color: {text_main}; background: {bg_card}; border: 1px solid {border}; padding: 4px; }}
+#themeButton {{ background: {bg_card}; border: 1px solid {border}; border-radius: 18px; }}
+#closeButton {{ color: #94A3B8; border: none; font-weight: bold; font-size: 16px; }}
+#viewPill {{ background: {bg_card}; border: 1px solid {border}; border-right: none; color: {text_sub};
+    padding: 8px 20px; font-weight: 700; }}
+#viewPill:checked {{ background: {pill_bg}; color: {pill_fg}; }}
+#viewPill[edge="first"] {{ border-top-left-radius: 6px; border-bottom-left-radius: 6px; }}
+#viewPill[edge="last"] {{ border-right: 1px solid {border}; border-top-right-radius: 6px; border-bottom-right-radius: 6px; }}
+#kpiLabel {{ color: #94A3B8; font-size: 11px; font-weight: 800; letter-spacing: 0.5px; }}
+#kpiValue {{ font-size: 24px; font-weight: 900; }}
+#kpiValue[kpi="units"] {{ color: #6366F1; }}
+#kpiValue[kpi="flow"] {{ color: #3B82F6; }}
+#kpiValue[kpi="press"] {{ color: #10B981; }}
+#kpiValue[kpi="temp"] {{ color: #F59E0B; }}
+#stageStatus {{ color: #94A3B8; font-size: 14px; font-weight: 700; }}
+#chartCard, #insightCard, #dataCard {{ background: {bg_card}; border: 1px solid {border}; border-radius: 12px; }}
+#cardTitle {{ color: #94A3B8; font-weight: 800; font-size: 12px; letter-spacing: 1px; }}
+#dataCard QTableView {{ background: transparent; border: none; color: {text_main}; gridline-color: {border}; }}
+#dataCard QHeaderView::section {{ background: {header_bg}; color: #94A3B8; border: none; padding: 12px;
+    font-weight: bold; text-transform: uppercase; }}
+#sideScroll, #sideScroll #qt_scrollarea_viewport, #sideList {{ border: none; background: transparent; }}
+#nominalLabel {{ color: #10B981; font-weight: bold; }}
+#outlierList {{ border: none; background: transparent; }}
+#corrLabel {{ color: {text_main}; font-weight: bold; margin-top: 10px; }}
+#corrCell {{ background: {cell_bg}; color: {text_main}; border-radius: 4px; font-size: 11px; }}
+#corrCell[strong="true"] {{ background: #3B82F6; color: white; }}
+"""
+
+# Matplotlib is not thread-safe (text rendering shares font caches), so pool
+# renders of different windows' figures take this one lock. The GUI thread
+# never takes it: it only edits a figure while no frame of it is rendering.
+_RENDER_LOCK = threading.Lock()
+
+# KPI bar cells: (key, bound value formatter), in display order
+_KPIS = (("units", str), ("flow", "{:.2f} m³/h".format), ("press", "{:.2f} bar".format),
+         ("temp", "{:.2f} °C".format))
+
+# The analytics fields the window reads, bound once per load; absent keys
+# fall back to empty containers, immutable since every instance shares them
+_Analytics = namedtuple(
+    "_Analytics",
+    "scatter_data outlier_equipment peer_benchmarks equipment_type_distribution correlation_matrix",
+    defaults=((), (), MappingProxyType({}), MappingProxyType({}), ()),
+)
+
+# Required fields of an equipment record, pulled in one C-level call per row
+_EQ_FIELDS = operator.itemgetter("equipment_name", "equipment_type", "flowrate", "pressure", "temperature")
+
+@functools.lru_cache(maxsize=None)
+def _detail_stylesheet(dark):
+    """The window stylesheet for a theme, formatted once per process."""
+    return _DETAIL_QSS.format(**_THEMES[dark])
+
+class EquipmentTableModel(QAbstractTableModel):
+    """
+    Read-only model over the equipment list.
+    A filter only selects rows of the dataset's arrays; cell strings are then
+    formatted into parallel columns in batches as the view scrolls
+    (canFetchMore/fetchMore), so opening a large table costs one batch and
+    data() is a plain list lookup for the painted rows. A few more batches
+    are streamed in ahead of the scroll position, one per timer tick, up to
+    STREAM_LIMIT rows; anything beyond that is only formatted when the view
+    scrolls to it.
+    """
+    
+    HEADERS = ["Name", "Type", "Flow", "Press", "Temp", "Status"]
+    FETCH_BATCH = 500
+    STREAM_LIMIT = 2000  # Rows formatted ahead of scrolling
+    STREAM_INTERVAL_MS = 15
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.columns = tuple([] for _ in self.HEADERS)
+        self.is_outlier = []
+        self.source = self.rows = None
+        self.type_names = np.empty(0, dtype=object)
+        self.total = 0
+        self.stream_timer = QTimer(self)
+        self.stream_timer.setInterval(self.STREAM_INTERVAL_MS)
+        self.stream_timer.timeout.connect(self.stream_next)
+    
+    def set_equipment(self, names, type_codes, values, outlier, type_names):
+        """Take a dataset's per-row arrays (values is n x 3: flow, press, temp;
+        type_codes index into type_names)."""
+        self.source = (names, type_codes, values, outlier)
+        self.type_names = type_names
+    
+    def set_mask(self, mask):
+        """Show the rows selected by a boolean mask over the dataset."""
+        self.beginResetModel()
+        self.rows = tuple(arr[mask] for arr in self.source)
+        self.total = len(self.rows[3])
+        self.columns = tuple([] for _ in self.HEADERS)
+        self.is_outlier = []
+        self.append_rows(min(self.total, self.FETCH_BATCH))
+        self.endResetModel()
+        if self.canFetchMore():
+            self.stream_timer.start()
+        else:
+            self.stream_timer.stop()
+    
+    def stream_next(self):
+        self.fetchMore()
+        if not self.canFetchMore() or len(self.is_outlier) >= self.STREAM_LIMIT:
+            self.stream_timer.stop()
+    
+    def append_rows(self, count):
+        # Display strings are produced one batch per column by mapping a
+        # bound '%.2f' formatter over the slice
+        start = len(self.is_outlier)
+        stop = start + count
+        names, types, values, outlier = (arr[start:stop] for arr in self.rows)
+        fmt = '%.2f'.__mod__
+        batch = (
+            names.tolist(),
+            self.type_names[types].tolist(),
+            *(list(map(fmt, col.tolist())) for col in values.T),
+            [(_STATUS_ALERT if o else _STATUS_OK)[0] for o in outlier.tolist()],
+        )
+        for column, cells in zip(self.columns, batch):
+            column.extend(cells)
+        self.is_outlier.extend(outlier.tolist())
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self.is_outlier) < self.total
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        start = len(self.is_outlier)
+        count = min(self.total - start, self.FETCH_BATCH)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), start, start + count - 1)
+        self.append_rows(count)
+        self.endInsertRows()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.is_outlier)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return self.columns[index.column()][index.row()]
+        if role == Qt.UserRole:
+            return self.is_outlier[index.row()]
+        return None
+
+class CellDelegate(QStyledItemDelegate):
+    """
+    Table delegate that fills the style option from the display text alone.
+    Only text and alignment vary per cell, so this skips the font / colour /
+    check-state / decoration role queries the stock delegate makes against
+    the Python model for every painted cell. Numeric columns are centred.
+    Cell padding and the row separator are painted here rather than through
+    a QSS ::item rule, which would be resolved by the style sheet engine for
+    every cell on every repaint.
+    """
+    
+    ALIGN_TEXT = Qt.AlignLeft | Qt.AlignVCenter
+    ALIGN_NUMBER = Qt.AlignCenter
+    PADDING = 15  # The former 12px QSS padding plus the style's text margin
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.set_theme(False)
+    
+    def set_theme(self, dark):
+        self.separator = QColor(_THEMES[dark]["border"])
+    
+    def initStyleOption(self, option, index):
+        option.index = index
+        option.text = index.data(Qt.DisplayRole)
+        option.features |= QStyleOptionViewItem.HasDisplay
+        option.displayAlignment = self.ALIGN_NUMBER if index.column() >= 2 else self.ALIGN_TEXT
+    
+    def draw_background(self, painter, opt):
+        """Paint the item background / selection and separator; return the text."""
+        text, opt.text = opt.text, ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+        painter.save()
+        painter.setPen(self.separator)
+        painter.drawLine(opt.rect.bottomLeft(), opt.rect.bottomRight())
+        painter.restore()
+        return text
+    
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        text = self.draw_background(painter, opt)
+        rect = opt.rect.adjusted(self.PADDING, 0, -self.PADDING, 0)
+        selected = opt.state & QStyle.State_Selected
+        painter.save()
+        painter.setPen(opt.palette.color(QPalette.HighlightedText if selected else QPalette.Text))
+        painter.setFont(opt.font)
+        painter.drawText(rect, opt.displayAlignment, opt.fontMetrics.elidedText(text, Qt.ElideRight, rect.width()))
+        painter.restore()
+
+class StatusBadgeDelegate(CellDelegate):
+    """Paints the OK / ALERT pill in the status column (no per-row widgets)."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.font = QFont()
+        self.font.setBold(True)
+        self.font.setPixelSize(11)
+        self.brushes = {True: QColor(_STATUS_ALERT[1]), False: QColor(_STATUS_OK[1])}
+    
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        text = self.draw_background(painter, opt)
+        
+        badge = QRect(0, 0, 80, 26)
+        badge.moveCenter(option.rect.center())
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.brushes[index.data(Qt.UserRole)])
+        painter.drawRoundedRect(badge, 4, 4)
+        painter.setPen(Qt.white)
+        painter.setFont(self.font)
+        painter.drawText(badge, Qt.AlignCenter, text)
+        painter.restore()
+
+class OutlierDelegate(QStyledItemDelegate):
+    """Paints an outlier card (name + excursion note) per row of the insight list."""
+    
+    DESCRIPTION = "Parameter Excursion"
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.name_font = QFont()
+        self.name_font.setBold(True)
+        self.desc_font = QFont()
+        self.desc_font.setPixelSize(11)
+        self.row_height = 8 + QFontMetrics(self.name_font).height() + 2 + QFontMetrics(self.desc_font).height() + 8
+        self.set_theme(False)
+    
+    def set_theme(self, dark):
+        theme = _THEMES[dark]
+        self.colors = (QColor(theme["alert_bg"]), QColor(theme["alert_name"]), QColor(theme["alert_desc"]),
+                       QColor(_STATUS_ALERT[1]))
+    
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.row_height)
+    
+    def paint(self, painter, option, index):
+        bg, name_color, desc_color, bar_color = self.colors
+        rect = option.rect
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(bg)
+        painter.drawRoundedRect(rect, 4, 4)
+        painter.setBrush(bar_color)
+        painter.drawRect(QRect(rect.left(), rect.top(), 3, rect.height()))
+        text_rect = rect.adjusted(13, 8, -10, -8)
+        painter.setFont(self.name_font)
+        painter.setPen(name_color)
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignTop, index.data(Qt.DisplayRole))
+        painter.setFont(self.desc_font)
+        painter.setPen(desc_color)
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignBottom, self.DESCRIPTION)
+        painter.restore()
+
+class PieChart(QWidget):
+    """
+    Type-distribution pie for the sidebar, painted directly with QPainter.
+    It mirrors the matplotlib pie it replaces (counter-clockwise from 12
+    o'clock, names outside, percentages inside) without a Figure, layout
+    solve or Agg raster behind a single small chart.
+    """
+    
+    COLORS = ['#6366F1', '#3B82F6', '#10B981', '#F59E0B', '#EF4444']
+    LABEL_RADIUS = 1.1
+    PCT_RADIUS = 0.6
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.slices = []  # (label, label width, start deg, span deg, cos mid, sin mid, pct text)
+        self.brushes = [QColor(c) for c in self.COLORS]
+        self.label_font = QFont()
+        self.label_font.setPointSize(8)
+        self.label_metrics = QFontMetrics(self.label_font)
+        self.pct_font = QFont(self.label_font)
+        self.pct_font.setBold(True)
+        self.text_color = QColor("#1E293B")
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumSize(200, 200)
+    
+    def set_data(self, labels, values):
+        """Take slice names and a float array of their sizes."""
+        if not len(values):
+            self.slices = []
+        else:
+            pct = values * (100.0 / values.sum())
+            bounds = 90.0 + 3.6 * np.concatenate(([0.0], np.cumsum(pct)))
+            mid = np.deg2rad((bounds[:-1] + bounds[1:]) / 2)
+            widths = [self.label_metrics.horizontalAdvance(label) for label in labels]
+            self.slices = list(zip(labels, widths, bounds[:-1].tolist(), np.diff(bounds).tolist(),
+                                   np.cos(mid).tolist(), np.sin(mid).tolist(),
+                                   [f"{p:.1f}%" for p in pct.tolist()]))
+        self.update()
+    
+    def set_text_color(self, color):
+        self.text_color = QColor(color)
+        self.update()
+    
+    def paintEvent(self, event):
+        if not self.slices:
+            return
+        cx, cy = self.width() / 2, self.height() / 2
+        # Largest radius (at most filling the widget) that keeps every
+        # outside label inside it
+        radius = min(cx, cy)
+        line_height = self.label_metrics.height()
+        for _, width, _, _, x, y, _ in self.slices:
+            if abs(x) > 1e-6:
+                radius = min(radius, (cx - width - 4) / (self.LABEL_RADIUS * abs(x)))
+            if abs(y) > 1e-6:
+                radius = min(radius, (cy - line_height) / (self.LABEL_RADIUS * abs(y)))
+        radius = max(10.0, radius)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        box = QRectF(cx - radius, cy - radius, 2 * radius, 2 * radius)
+        for i, (_, _, start, span, _, _, _) in enumerate(self.slices):
+            painter.setBrush(self.brushes[i % len(self.brushes)])
+            painter.drawPie(box, round(start * 16), round(span * 16))
+        # Text is anchored at a point; x grows right, y grows down in Qt
+        for label, _, _, _, x, y, pct in self.slices:
+            lx, ly = cx + self.LABEL_RADIUS * radius * x, cy - self.LABEL_RADIUS * radius * y
+            anchor = QRectF(lx, ly - 50, 200, 100) if x > 0 else QRectF(lx - 200, ly - 50, 200, 100)
+            painter.setFont(self.label_font)
+            painter.setPen(self.text_color)
+            painter.drawText(anchor, (Qt.AlignLeft if x > 0 else Qt.AlignRight) | Qt.AlignVCenter, label)
+            px, py = cx + self.PCT_RADIUS * radius * x, cy - self.PCT_RADIUS * radius * y
+            painter.setFont(self.pct_font)
+            painter.setPen(Qt.white)
+            painter.drawText(QRectF(px - 50, py - 20, 100, 40), Qt.AlignCenter, pct)
+        painter.end()
+
+class _RenderTask(QRunnable):
+    """Rasterizes a SnapshotCanvas figure on a pool thread."""
+    
+    def __init__(self, canvas, snapshot_key):
+        super().__init__()
+        self.canvas, self.snapshot_key = canvas, snapshot_key
+        self.ratio = snapshot_key[2]
+    
+    def run(self):
+        try:
+            image, snapshot_key = self.canvas.render_image(self.snapshot_key), self.snapshot_key
+        except Exception:
+            logger.exception("Chart render failed")
+            image, snapshot_key = QImage(), None
+        try:
+            self.canvas.rendered.emit(image, self.ratio, snapshot_key)
+        except RuntimeError:
+            pass  # The window was closed while this frame was rendering
+
+class SnapshotCanvas(QLabel):
+    """Shows a Figure as a pixmap rendered off-screen with Agg.
+
+    The detail charts are static (no pan / zoom / picking), so a plain label
+    replaces FigureCanvasQTAgg and its event plumbing; Qt just blits the
+    pixmap on repaint. draw_idle() mirrors the canvas API and coalesces
+    redraws into one render per event-loop pass. The Agg render itself runs
+    on the global QThreadPool, one frame at a time per canvas, and the
+    finished image is handed back to the GUI thread. The widget size is only
+    recorded on the GUI thread and applied to the figure by the render
+    itself; owners must not edit the figure while `rendering` is set, and
+    frame_landed tells them when they can.
+
+    The figure's layout engine is run by hand, only when something that can
+    move the axes changed (size, labels, tick text, free text placement);
+    otherwise the previous subplot positions are kept and the draw skips
+    the layout solve.
+
+    While the widget is being drag-resized on a high-DPI screen, frames are
+    rendered at 1x; the full-resolution frame follows once the size has
+    settled.
+
+    Owners describe what the figure shows with set_content(key). The last
+    few frames are kept per (key, size, ratio), so going back to a chart
+    that was already rendered at this size is a pixmap swap, not a draw.
+    """
+    
+    MAX_PIXEL_RATIO = 2.0  # Beyond 2x the extra Agg pixels are not visibly sharper
+    RESIZE_SETTLE_MS = 150
+    SNAPSHOT_LIMIT = 6
+    
+    rendered = pyqtSignal(QImage, float, object)
+    frame_landed = pyqtSignal()  # No frame is rendering; the figure may be edited
+    
+    def __init__(self, figure, parent=None):
+        super().__init__(parent)
+        self.figure = figure
+        self.agg = FigureCanvasAgg(figure)
+        self.base_dpi = figure.dpi
+        self.size_inches = tuple(figure.get_size_inches())  # Applied to the figure at render time
+        self.engine = figure.get_layout_engine()
+        figure.set_layout_engine('none')  # Positions are kept between layouts
+        self.layout_key = None
+        self.content_key = None
+        self.snapshots = OrderedDict()  # (content key, size, ratio) -> QPixmap
+        self.pending = self.stale = False
+        self.rendering = self.rerender = False
+        self.rendered.connect(self.on_rendered)
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(self.RESIZE_SETTLE_MS)
+        self.settle_timer.timeout.connect(self.on_resize_settled)
+        self.setAlignment(Qt.AlignCenter)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumSize(10, 10)
+    
+    def sizeHint(self):
+        w, h = self.size_inches
+        return QSize(int(w * self.base_dpi), int(h * self.base_dpi))
+    
+    def minimumSizeHint(self):
+        return QSize(10, 10)
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        size = event.size()
+        self.size_inches = (size.width() / self.base_dpi, size.height() / self.base_dpi)
+        if self.pixmap() is not None:
+            self.settle_timer.start()  # A resize of a chart already on screen
+        self.draw_idle()
+    
+    def on_resize_settled(self):
+        if self.devicePixelRatioF() > 1.0:
+            self.draw_idle()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.stale:
+            self.draw_idle()
+    
+    def set_content(self, key):
+        """Mark the figure as showing `key` (call after editing it, while not rendering)."""
+        self.content_key = key
+        self.draw_idle()
+    
+    def draw_idle(self):
+        if not self.pending:
+            self.pending = True
+            QTimer.singleShot(0, self.redraw)
+    
+    def redraw(self):
+        self.pending = False
+        # Hidden pages (other view, detached pie) render when next shown
+        self.stale = not self.isVisible()
+        if self.stale:
+            return
+        ratio = 1.0 if self.settle_timer.isActive() else min(self.devicePixelRatioF(), self.MAX_PIXEL_RATIO)
+        snapshot_key = (self.content_key, self.size_inches, ratio)
+        pixmap = self.snapshots.get(snapshot_key)
+        if pixmap is not None:
+            self.snapshots.move_to_end(snapshot_key)
+            self.setPixmap(pixmap)
+            if self.rendering:
+                self.rerender = True  # Re-check once the frame in flight has landed
+            return
+        if self.rendering:
+            self.rerender = True  # Picked up when the current frame lands
+            return
+        self.rendering = True
+        QThreadPool.globalInstance().start(_RenderTask(self, snapshot_key))
+    
+    def render_image(self, snapshot_key):
+        """Draw the figure for a (content, size, ratio) key and return it as an image.
+
+        Runs on a pool thread while the GUI thread leaves the figure alone.
+        """
+        _, size_inches, ratio = snapshot_key
+        with _RENDER_LOCK:
+            self.figure.set_size_inches(size_inches, forward=False)
+            self.figure.set_dpi(self.base_dpi * ratio)
+            key = self.layout_signature()
+            if self.engine is not None and key != self.layout_key:
+                self.engine.execute(self.figure)
+                self.layout_key = key
+            self.agg.draw()
+            buf = self.agg.buffer_rgba()
+            # The figure patch is always opaque, so the alpha byte can be ignored;
+            # an RGBX image converts to a pixmap without an alpha pass. Copy it
+            # off the Agg buffer before the lock is released.
+            image = QImage(buf, buf.shape[1], buf.shape[0], QImage.Format_RGBX8888).copy()
+            return image
+    
+    def on_rendered(self, image, ratio, snapshot_key):
+        self.rendering = False
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(ratio)
+            # A frame of content that was swapped out while it rendered is
+            # only cached, not shown
+            if snapshot_key[0] == self.content_key:
+                self.setPixmap(pixmap)
+            if snapshot_key[0] is not None:
+                self.snapshots[snapshot_key] = pixmap
+                self.snapshots.move_to_end(snapshot_key)
+                while len(self.snapshots) > self.SNAPSHOT_LIMIT:
+                    self.snapshots.popitem(last=False)
+        self.frame_landed.emit()
+        if self.rerender:
+            self.rerender = False
+            self.draw_idle()
+    
+    def layout_signature(self):
+        fig = self.figure
+        key = [fig.dpi, tuple(fig.get_size_inches())]
+        for ax in fig.axes:
+            key.append((ax.get_xlabel(), ax.get_ylabel(), ax.get_title(), ax.axison))
+            for axis in (ax.xaxis, ax.yaxis):
+                key.append(tuple(axis.get_major_formatter().format_ticks(axis.get_majorticklocs())))
+            key.extend((t.get_text(), t.get_position()) for t in ax.texts)
+        return key
+
+class DetailLoadThread(QThread):
+    finished = pyqtSignal(dict)
+    def __init__(self, api_client, dataset_id):
+        super().__init__()
+        self.api_client, self.dataset_id = api_client, dataset_id
+    def run(self):
+        # An exception escaping QThread.run would abort the application
+        try:
+            res = self.api_client.fetch_detail_bundle(self.dataset_id)
+        except Exception as e:
+            res = {"success": False, "error": str(e)}
+        self.finished.emit(res)
+
 class DatasetDetailWindow(QMainWindow):
     """
     World-Class Desktop Dashboard (PyQt5)
     Features: Spacious Web-Like Table, Dynamic Math, Dark Mode.
     """
     
+    closed = pyqtSignal(object)  # dataset id
+    bundle_loaded = pyqtSignal(object)  # dataset id, once its analytics and equipment arrived
+    
+    REFRESH_DELAY_MS = 50
+    
     def __init__(self, api_client, dataset, parent=None):
         super().__init__(parent)
         self.api_client = api_client
         self.dataset = dataset
-        self.analytics = {}
-        self.equipment = []
-        self.filtered_equipment = []
+        self.dataset_id = dataset["id"]
+        self.analytics = _Analytics()
         self.current_view = "safety" 
         self.is_dark_mode = False 
         
+        # Persistent chart surfaces (created with the chart page; the pie canvas
+        # is re-parented whenever the sidebar is rebuilt)
+        self.figure = self.canvas = self.ax = None
+        self.pie_chart = None  # Sidebar pie for the dist view, re-parented like the list below
+        self.outlier_view = None  # Insight list for the safety view, reused like the pie
+        
+        # Data is loaded once per window, so chart keys built from the view,
+        # filter and theme let redraws be skipped when nothing has changed
+        self.chart_key = self.sidebar_key = self.pie_key = None
+        self.ax_view = self.ax_artists = None  # chart kind on self.ax and its reusable artists
+        self.charts_pending = False  # A chart edit waiting for the frame in flight to land
+        
+        # Table model is only refilled when the data page is shown with stale rows
+        self.table_model = EquipmentTableModel(self)
+        self.cell_delegate = CellDelegate(self)
+        self.status_delegate = StatusBadgeDelegate(self)
+        self.table_dirty = False
+        self.loaded = False
+        
+        # Data, filter, view and theme changes arriving in a burst are folded
+        # into one update_ui() pass
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(self.REFRESH_DELAY_MS)
+        self.refresh_timer.timeout.connect(self.update_ui)
+        
         self.init_ui()
         self.load_data()
         self.apply_theme() 
     
     def init_ui(self):
+        filename = self.dataset.get('filename')
         self.resize(1280, 850)
-        self.setWindowTitle(f"Analysis: {self.dataset.get('filename')}")
+        self.setWindowTitle(f"Analysis: {filename}")
         
         self.central = QWidget()
+        self.central.setObjectName("detailCentral")
         self.setCentralWidget(self.central)
         self.main_layout = QVBoxLayout(self.central)
         self.main_layout.setSpacing(0)
@@ -44,16 +647,17 @@ class DatasetDetailWindow(QMainWindow):
 
         # 1. HEADER
         self.header = QFrame()
+        self.header.setObjectName("detailHeader")
         h_layout = QHBoxLayout(self.header)
         h_layout.setContentsMargins(24, 12, 24, 12)
         h_layout.setSpacing(20)
         
-        self.title_lbl = QLabel(f"{self.dataset.get('filename')}")
-        self.title_lbl.setStyleSheet("font-size: 18px; font-weight: 900;")
+        self.title_lbl = QLabel(f"{filename}")
+        self.title_lbl.setObjectName("detailTitle")
         h_layout.addWidget(self.title_lbl)
         
         f_lbl = QLabel("FILTER:")
-        f_lbl.setStyleSheet("font-weight: 700; color: #94A3B8; font-size: 11px;")
+        f_lbl.setObjectName("filterLabel")
         h_layout.addWidget(f_lbl)
         
         self.filter_combo = QComboBox()
@@ -74,6 +678,8 @@ class DatasetDetailWindow(QMainWindow):
         
         for i, (id, txt) in enumerate(views):
             btn = QPushButton(txt)
+            btn.setObjectName("viewPill")
+            btn.setProperty("edge", "first" if i == 0 else "last" if i == len(views) - 1 else "")
             btn.setCheckable(True)
             if i == 0: btn.setChecked(True)
             self.btn_group.addButton(btn)
@@ -85,6 +691,7 @@ class DatasetDetailWindow(QMainWindow):
         h_layout.addSpacing(20)
         
         self.theme_btn = QPushButton("🌙")
+        self.theme_btn.setObjectName("themeButton")
         self.theme_btn.setFixedSize(36, 36)
         self.theme_btn.setCursor(Qt.PointingHandCursor)
         self.theme_btn.clicked.connect(self.toggle_theme)
@@ -94,33 +701,43 @@ class DatasetDetailWindow(QMainWindow):
         close_btn.setFixedSize(30, 30)
         close_btn.setCursor(Qt.PointingHandCursor)
         close_btn.clicked.connect(self.close)
-        close_btn.setStyleSheet("color: #94A3B8; border: none; font-weight: bold; font-size: 16px;")
+        close_btn.setObjectName("closeButton")
         h_layout.addWidget(close_btn)
         
         self.main_layout.addWidget(self.header)
 
         # 2. KPI BAR
         self.kpi_frame = QFrame()
+        self.kpi_frame.setObjectName("detailKpis")
         k_layout = QHBoxLayout(self.kpi_frame)
         k_layout.setContentsMargins(24, 20, 24, 20)
         k_layout.setSpacing(40)
         
         self.kpis = {}
-        for k in ['units', 'flow', 'press', 'temp']:
+        for k, _ in _KPIS:
             v_box = QVBoxLayout()
-            l = QLabel(k.upper()); l.setStyleSheet("color:#94A3B8; font-size:11px; font-weight:800; letter-spacing: 0.5px;")
-            v = QLabel("-"); v.setStyleSheet("font-size:24px; font-weight:900;")
+            l = QLabel(k.upper()); l.setObjectName("kpiLabel")
+            v = QLabel("-"); v.setObjectName("kpiValue"); v.setProperty("kpi", k)
             self.kpis[k] = v
             v_box.addWidget(l); v_box.addWidget(v)
             k_layout.addLayout(v_box)
         k_layout.addStretch()
         self.main_layout.addWidget(self.kpi_frame)
 
-        # 3. STAGE
+        # 3. STAGE (each page is built the first time its view is shown, then reused)
         self.stage_container = QWidget()
         self.stage_layout = QVBoxLayout(self.stage_container)
         self.stage_layout.setContentsMargins(24, 24, 24, 24)
+        self.stage = QStackedWidget()
+        self.stage_layout.addWidget(self.stage)
         self.main_layout.addWidget(self.stage_container)
+        self.chart_page = self.data_page = None
+        
+        # Placeholder shown while the detail data is fetched in the background
+        self.status_lbl = QLabel("Loading dataset…")
+        self.status_lbl.setAlignment(Qt.AlignCenter)
+        self.status_lbl.setObjectName("stageStatus")
+        self.stage.addWidget(self.status_lbl)
 
     def add_shadow(self, widget):
         shadow = QGraphicsDropShadowEffect()
@@ -130,124 +747,169 @@ class DatasetDetailWindow(QMainWindow):
         widget.setGraphicsEffect(shadow)
 
     def load_data(self):
+        # Both endpoints are fetched concurrently off the GUI thread
+        self.loader = DetailLoadThread(self.api_client, self.dataset_id)
+        self.loader.finished.connect(self.on_data_loaded)
+        self.loader.start()
+
+    def closeEvent(self, event):
+        self.closed.emit(self.dataset_id)
+        # Free the window, but not while its loader thread is still running
+        if self.loader.isRunning():
+            self.loader.finished.connect(lambda _: (self.loader.wait(), self.deleteLater()))
+        else:
+            self.deleteLater()
+        super().closeEvent(event)
+
+    def on_data_loaded(self, res):
+        if not res["success"]:
+            logger.error(res.get("error", "Failed to load dataset"))
+            self.status_lbl.setText("⚠️ Failed to load dataset")
+            return
         try:
-            res_a = self.api_client.get_analytics(self.dataset["id"])
-            res_e = self.api_client.get_equipment(self.dataset["id"])
-            if res_a["success"] and res_e["success"]:
-                self.analytics = res_a["data"]
-                self.equipment = res_e["data"]
-                self.filtered_equipment = self.equipment
-                
-                types = sorted(list(set(e['equipment_type'] for e in self.equipment)))
-                self.filter_combo.blockSignals(True)
-                self.filter_combo.clear()
-                self.filter_combo.addItem("All Equipment")
-                for t in types: self.filter_combo.addItem(t)
-                self.filter_combo.blockSignals(False)
-                
-                self.update_ui()
-        except Exception as e:
-            logger.error(str(e))
+            payload = res["data"]["analytics"]
+            self.analytics = _Analytics(**{k: payload[k] for k in _Analytics._fields if k in payload})
+            self.index_scatter()
+            self.index_equipment(res["data"]["equipment"])
+            self.table_dirty = True
+            self.loaded = True  # Only once every array update_ui reads is in place
+            
+            self.filter_combo.blockSignals(True)
+            self.filter_combo.clear()
+            self.filter_combo.addItem("All Equipment")
+            for t in self.eq_type_names.tolist(): self.filter_combo.addItem(t)
+            self.filter_combo.blockSignals(False)
+            
+            self.schedule_update()
+            self.bundle_loaded.emit(self.dataset['id'])
+        except Exception:
+            logger.exception("Failed to index dataset %s", self.dataset_id)
+            self.status_lbl.setText("⚠️ Failed to load dataset")
+
+    def index_equipment(self, eq):
+        """Pull the equipment list into compact column arrays once per load.
+
+        The response dicts are not kept. Types are stored as uint8 codes into
+        the sorted type names rather than as a fixed-width string per row.
+        """
+        n = len(eq)
+        # One pass over the records, transposed into per-field tuples
+        names, types, *values = zip(*map(_EQ_FIELDS, eq)) if n else ((),) * 5
+        self.eq_names = np.array(names, dtype=object)
+        self.eq_type_names, codes = np.unique(np.array(types, dtype=object), return_inverse=True)
+        self.eq_type_codes = codes.astype(np.min_scalar_type(len(self.eq_type_names)))
+        self.eq_values = np.ascontiguousarray(np.array(values, dtype=np.float64).T)
+        self.eq_outlier = np.fromiter(
+            (bool(e.get('is_pressure_outlier') or e.get('is_temperature_outlier')) for e in eq),
+            dtype=bool, count=n
+        )
+        self.eq_mask = np.ones(n, dtype=bool)
+        self.table_model.set_equipment(self.eq_names, self.eq_type_codes, self.eq_values, self.eq_outlier,
+                                       self.eq_type_names)
+
+    def index_scatter(self):
+        """Scatter points as arrays, so filtering and the outlier split are masks."""
+        data = self.analytics.scatter_data
+        outliers = {o['name'] for o in self.analytics.outlier_equipment}
+        self.sc_xy = self.xy_points(data)
+        self.sc_sizes = np.array([d.get('r', 5) * 5 for d in data], dtype=np.float64)
+        self.sc_types = np.array([d['type'] for d in data], dtype=str)
+        self.sc_alert = np.array([d['name'] in outliers for d in data], dtype=bool)
 
     def toggle_theme(self):
         self.is_dark_mode = not self.is_dark_mode
         self.apply_theme()
-        self.update_ui()
+        self.schedule_update()
 
     def apply_theme(self):
-        if self.is_dark_mode:
-            bg_main = "#0F172A"; bg_card = "#1E293B"; text_main = "#F8FAFC"; text_sub = "#94A3B8"; border = "#334155"
-            self.theme_btn.setText("☀️")
-        else:
-            bg_main = "#F8FAFC"; bg_card = "#FFFFFF"; text_main = "#1E293B"; text_sub = "#64748B"; border = "#E2E8F0"
-            self.theme_btn.setText("🌙")
-
-        self.central.setStyleSheet(f"background-color: {bg_main};")
-        self.header.setStyleSheet(f"background: {bg_card}; border-bottom: 1px solid {border};")
-        self.title_lbl.setStyleSheet(f"font-size: 18px; font-weight: 900; color: {text_main}; border: none;")
-        self.kpi_frame.setStyleSheet(f"background: {bg_card}; border-bottom: 1px solid {border};")
-        
-        colors = {'units': '#6366F1', 'flow': '#3B82F6', 'press': '#10B981', 'temp': '#F59E0B'}
-        for k, v in self.kpis.items():
-            v.setStyleSheet(f"font-size: 24px; font-weight: 900; color: {colors[k]}; border: none;")
-
-        for i, (id, btn) in enumerate(self.view_btns.items()):
-            radius = "border-top-left-radius: 6px; border-bottom-left-radius: 6px;" if i==0 else \
-                     "border-top-right-radius: 6px; border-bottom-right-radius: 6px;" if i==3 else ""
-            border_right = "border-right: none;" if i < 3 else ""
-            is_active = btn.isChecked()
-            btn_bg = ("#3B82F6" if not self.is_dark_mode else "#60A5FA") if is_active else bg_card
-            btn_fg = ("white" if not self.is_dark_mode else "#0F172A") if is_active else text_sub
-            btn.setStyleSheet(f"""
-                QPushButton {{ background: {btn_bg}; border: 1px solid {border}; color: {btn_fg}; 
-                    padding: 8px 20px; font-weight: 700; {radius} {border_right} }}
-            """)
-
-        self.filter_combo.setStyleSheet(f"color: {text_main}; background: {bg_card}; border: 1px solid {border}; padding: 4px;")
-        self.theme_btn.setStyleSheet(f"background: {bg_card}; border: 1px solid {border}; border-radius: 18px;")
+        self.theme_btn.setText("☀️" if self.is_dark_mode else "🌙")
+        self.cell_delegate.set_theme(self.is_dark_mode)
+        self.status_delegate.set_theme(self.is_dark_mode)
+        self.setStyleSheet(_detail_stylesheet(self.is_dark_mode))
 
     def switch_view(self, view_id):
+        # The pill highlight is the :checked state, so a view switch needs no restyle
         self.current_view = view_id
-        self.apply_theme()
-        self.update_ui()
+        self.view_btns[view_id].setChecked(True)
+        self.schedule_update()
 
     def apply_filter(self, text):
         if text == "All Equipment":
-            self.filtered_equipment = self.equipment
+            self.eq_mask = np.ones(len(self.eq_names), dtype=bool)
         else:
-            self.filtered_equipment = [e for e in self.equipment if e['equipment_type'] == text]
-        self.update_ui()
+            code = np.flatnonzero(self.eq_type_names == text)
+            self.eq_mask = (self.eq_type_codes == code[0]) if len(code) else np.zeros(len(self.eq_names), dtype=bool)
+        self.table_dirty = True
+        self.schedule_update()
 
-    def clear_stage(self):
-        while self.stage_layout.count():
-            item = self.stage_layout.takeAt(0)
+    def clear_sidebar(self):
+        # Detach the cached pie canvas / outlier list so they survive the teardown
+        if self.pie_chart is not None: self.pie_chart.setParent(None)
+        if self.outlier_view is not None: self.outlier_view.setParent(None)
+        while self.side_content_area.count():
+            item = self.side_content_area.takeAt(0)
             if item.widget(): item.widget().deleteLater()
 
-    def update_ui(self):
-        # Dynamic Math
-        count = len(self.filtered_equipment)
-        if count > 0:
-            avg_flow = sum(e['flowrate'] for e in self.filtered_equipment) / count
-            avg_press = sum(e['pressure'] for e in self.filtered_equipment) / count
-            avg_temp = sum(e['temperature'] for e in self.filtered_equipment) / count
-        else:
-            avg_flow = avg_press = avg_temp = 0
+    def schedule_update(self):
+        # Restarting the timer pushes the pending refresh past the latest change
+        self.refresh_timer.start()
 
-        self.kpis['units'].setText(str(count))
-        self.kpis['flow'].setText(f"{avg_flow:.2f} m³/h")
-        self.kpis['press'].setText(f"{avg_press:.2f} bar")
-        self.kpis['temp'].setText(f"{avg_temp:.2f} °C")
+    def update_ui(self):
+        if not self.loaded:
+            return  # View/filter/theme picks are applied once the data arrives
+        
+        # Dynamic Math (vectorized over the filtered rows)
+        values = self.eq_values[self.eq_mask]
+        count = len(values)
+        avg_flow, avg_press, avg_temp = values.mean(axis=0) if count > 0 else (0, 0, 0)
+        self.n_outliers = int(np.count_nonzero(self.eq_outlier[self.eq_mask]))
 
-        self.clear_stage()
+        for (k, fmt), value in zip(_KPIS, (count, avg_flow, avg_press, avg_temp)):
+            self.kpis[k].setText(fmt(value))
 
         if self.current_view == "data":
-            self.build_data_view()
+            if self.data_page is None: self.build_data_view()
+            if self.table_dirty:
+                self.table_model.set_mask(self.eq_mask)
+                self.table_dirty = False
+            self.stage.setCurrentWidget(self.data_page)
         else:
-            self.build_chart_view()
+            if self.chart_page is None: self.build_chart_view()
+            titles = {'safety': "Process Envelope", 'dist': "Flowrate Distribution", 'corr': "Correlation Analysis"}
+            self.chart_title.setText(titles.get(self.current_view, ""))
+            self.stage.setCurrentWidget(self.chart_page)
+            # Artists are not edited while the previous frame is still
+            # rasterizing on a pool thread; on_frame_landed applies the edit
+            if self.canvas.rendering:
+                self.charts_pending = True
+            else:
+                self.render_charts()
+            # The sidebar only depends on the same inputs as the chart, so an
+            # update that leaves them unchanged keeps the widgets it built last
+            sidebar_key = (self.current_view, self.filter_combo.currentText(), self.is_dark_mode)
+            if sidebar_key != self.sidebar_key:
+                self.sidebar_key = sidebar_key
+                # Rebuild the insight list off-screen and repaint the card once
+                self.insight_card.setUpdatesEnabled(False)
+                try:
+                    self.clear_sidebar()
+                    self.populate_sidebar()
+                finally:
+                    self.insight_card.setUpdatesEnabled(True)
 
     def build_data_view(self):
-        # Style
-        bg_card = "#1E293B" if self.is_dark_mode else "white"
-        text_main = "#F8FAFC" if self.is_dark_mode else "#1E293B"
-        border = "#334155" if self.is_dark_mode else "#E2E8F0"
-        header_bg = "#0F172A" if self.is_dark_mode else "#F8FAFC"
-        
-        container = QFrame()
-        container.setStyleSheet(f"background: {bg_card}; border-radius: 12px; border: 1px solid {border};")
-        self.add_shadow(container)
+        self.data_page = QFrame()
+        self.data_page.setObjectName("dataCard")
+        self.add_shadow(self.data_page)
         
-        layout = QVBoxLayout(container)
+        layout = QVBoxLayout(self.data_page)
         layout.setContentsMargins(0,0,0,0)
         
-        self.table = QTableWidget()
-        self.table.setStyleSheet(f"""
-            QTableWidget {{ background: transparent; border: none; color: {text_main}; gridline-color: {border}; }}
-            QHeaderView::section {{ background: {header_bg}; color: #94A3B8; border: none; padding: 12px; font-weight: bold; text-transform: uppercase; }}
-            QTableWidget::item {{ padding: 12px; border-bottom: 1px solid {border}; }}
-        """)
+        self.table = QTableView()
         self.table.setShowGrid(False)
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["Name", "Type", "Flow", "Press", "Temp", "Status"])
+        self.table.setModel(self.table_model)
+        self.table.setItemDelegate(self.cell_delegate)
+        self.table.setItemDelegateForColumn(5, self.status_delegate)
         self.table.verticalHeader().setVisible(False)
         
         # --- FIXED TABLE SPACING ---
@@ -263,202 +925,242 @@ class DatasetDetailWindow(QMainWindow):
         header.setSectionResizeMode(4, QHeaderView.Fixed); self.table.setColumnWidth(4, 100) # Temp
         header.setSectionResizeMode(5, QHeaderView.Fixed); self.table.setColumnWidth(5, 120) # Status
         
-        # Make rows taller (Web-like spacing)
-        self.table.verticalHeader().setDefaultSectionSize(50) 
+        # Make rows taller (Web-like spacing); rows are never resized, so
+        # every row keeps the one default height and nothing is measured
+        v_header = self.table.verticalHeader()
+        v_header.setSectionResizeMode(QHeaderView.Fixed)
+        v_header.setDefaultSectionSize(50)
         
-        self.table.setRowCount(len(self.filtered_equipment))
-        
-        for r, eq in enumerate(self.filtered_equipment):
-            self.table.setItem(r,0, QTableWidgetItem(eq['equipment_name']))
-            self.table.setItem(r,1, QTableWidgetItem(eq['equipment_type']))
-            
-            # Center Align Numbers
-            for c, val in enumerate([eq['flowrate'], eq['pressure'], eq['temperature']], start=2):
-                item = QTableWidgetItem(f"{val:.2f}")
-                item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(r, c, item)
-            
-            alert = eq.get('is_pressure_outlier') or eq.get('is_temperature_outlier')
-            
-            # Status Badge
-            w = QWidget()
-            wl = QHBoxLayout(w); wl.setContentsMargins(0,0,0,0); wl.setAlignment(Qt.AlignCenter)
-            lbl = QLabel("⚠️ ALERT" if alert else "OK")
-            lbl.setFixedSize(80, 26)
-            lbl.setAlignment(Qt.AlignCenter)
-            lbl.setStyleSheet(f"background: {'#EF4444' if alert else '#10B981'}; color: white; border-radius: 4px; font-weight: bold; font-size: 11px;")
-            wl.addWidget(lbl)
-            self.table.setCellWidget(r, 5, w)
-            
         layout.addWidget(self.table)
-        self.stage_layout.addWidget(container)
+        self.stage.addWidget(self.data_page)
 
     def build_chart_view(self):
-        bg_card = "#1E293B" if self.is_dark_mode else "white"
-        text_sub = "#94A3B8"
-        border = "#334155" if self.is_dark_mode else "#E2E8F0"
-        
-        split_container = QWidget()
-        split_layout = QHBoxLayout(split_container)
+        self.chart_page = QWidget()
+        split_layout = QHBoxLayout(self.chart_page)
         split_layout.setContentsMargins(0,0,0,0)
         split_layout.setSpacing(24)
         
         # Chart Card
-        c_frame = QFrame()
-        c_frame.setStyleSheet(f"background:{bg_card}; border:1px solid {border}; border-radius:12px;")
-        self.add_shadow(c_frame)
-        cv = QVBoxLayout(c_frame)
+        self.chart_card = QFrame()
+        self.chart_card.setObjectName("chartCard")
+        self.add_shadow(self.chart_card)
+        cv = QVBoxLayout(self.chart_card)
         cv.setContentsMargins(20,20,20,20)
         
-        titles = {'safety': "Process Envelope", 'dist': "Flowrate Distribution", 'corr': "Correlation Analysis"}
-        title_lbl = QLabel(titles.get(self.current_view, ""))
-        title_lbl.setStyleSheet(f"color: {text_sub}; font-weight: 800; font-size: 12px; letter-spacing: 1px; border: none;")
-        cv.addWidget(title_lbl)
+        self.chart_title = QLabel()
+        self.chart_title.setObjectName("cardTitle")
+        cv.addWidget(self.chart_title)
         
-        self.figure = Figure(figsize=(8, 5), dpi=100)
-        self.canvas = FigureCanvas(self.figure)
+        self.figure = Figure(figsize=(8, 5), dpi=100, layout='constrained')
+        self.canvas = SnapshotCanvas(self.figure)
+        self.canvas.frame_landed.connect(self.on_frame_landed)
+        self.ax = self.figure.add_subplot(111)
         cv.addWidget(self.canvas)
-        split_layout.addWidget(c_frame, 65)
+        split_layout.addWidget(self.chart_card, 65)
         
         # Insight Card
-        i_frame = QFrame()
-        i_frame.setStyleSheet(f"background:{bg_card}; border:1px solid {border}; border-radius:12px;")
-        self.add_shadow(i_frame)
-        iv = QVBoxLayout(i_frame)
+        self.insight_card = QFrame()
+        self.insight_card.setObjectName("insightCard")
+        self.add_shadow(self.insight_card)
+        iv = QVBoxLayout(self.insight_card)
         iv.setContentsMargins(20,20,20,20)
         
-        lbl = QLabel("INSIGHTS")
-        lbl.setStyleSheet(f"color: {text_sub}; font-weight: 800; font-size: 12px; letter-spacing: 1px; border: none;")
-        iv.addWidget(lbl)
+        self.insight_title = QLabel("INSIGHTS")
+        self.insight_title.setObjectName("cardTitle")
+        iv.addWidget(self.insight_title)
         
         self.side_content_area = QVBoxLayout() 
         iv.addLayout(self.side_content_area)
         
-        split_layout.addWidget(i_frame, 35)
-        self.stage_layout.addWidget(split_container)
-        
-        self.render_charts()
-        self.populate_sidebar()
+        split_layout.addWidget(self.insight_card, 35)
+        self.stage.addWidget(self.chart_page)
+
+    def on_frame_landed(self):
+        if self.charts_pending:
+            self.charts_pending = False
+            if self.current_view != "data":
+                self.render_charts()
 
     def render_charts(self):
+        filter_type = self.filter_combo.currentText()
+        key = (self.current_view, filter_type, self.is_dark_mode)
+        if key == self.chart_key:
+            return  # The persistent canvas already shows exactly this chart
+        self.chart_key = key
+        
         bg_color = "#1E293B" if self.is_dark_mode else "white"
         text_color = "white" if self.is_dark_mode else "#334155"
         self.figure.patch.set_facecolor(bg_color)
         
-        all_data = self.analytics.get('scatter_data', [])
-        filter_type = self.filter_combo.currentText()
-        data = [d for d in all_data if d['type'] == filter_type] if filter_type != "All Equipment" else all_data
+        if filter_type == "All Equipment":
+            mask = np.ones(len(self.sc_xy), dtype=bool)
+        else:
+            mask = self.sc_types == filter_type
 
-        ax = self.figure.add_subplot(111)
-        ax.set_facecolor(bg_color)
-        ax.tick_params(colors=text_color, which='both')
-        for spine in ax.spines.values(): spine.set_color(text_color)
-        ax.xaxis.label.set_color(text_color); ax.yaxis.label.set_color(text_color)
+        ax = self.ax
+        if self.current_view != self.ax_view:
+            # Only a different chart kind needs a blank Axes; filter, theme and
+            # data changes within a view mutate the artists drawn last time.
+            ax.clear()
+            self.ax_view, self.ax_artists = self.current_view, None
+        self.style_axes(bg_color, text_color)
         
         if self.current_view == 'safety':
-            outliers = {o['name'] for o in self.analytics.get('outlier_equipment', [])}
-            safe = [d for d in data if d['name'] not in outliers]
-            risk = [d for d in data if d['name'] in outliers]
-            ax.scatter([d['x'] for d in safe], [d['y'] for d in safe], c='#10B981', alpha=0.6, s=60, label='Safe', edgecolors='none')
-            ax.scatter([d['x'] for d in risk], [d['y'] for d in risk], c='#EF4444', marker='^', s=90, label='Alert', edgecolors='white')
-            ax.set_xlabel("Pressure (bar)"); ax.set_ylabel("Temp (°C)")
-            ax.legend(facecolor=bg_color, edgecolor=text_color, labelcolor=text_color)
-            ax.grid(True, linestyle='--', alpha=0.1)
+            safe = self.sc_xy[mask & ~self.sc_alert]
+            risk = self.sc_xy[mask & self.sc_alert]
+            if self.ax_artists is None:
+                self.ax_artists = (
+                    ax.scatter(safe[:, 0], safe[:, 1], c='#10B981', alpha=0.6, s=60, label='Safe', edgecolors='none'),
+                    ax.scatter(risk[:, 0], risk[:, 1], c='#EF4444', marker='^', s=90, label='Alert', edgecolors='white'),
+                )
+                ax.set_xlabel("Pressure (bar)"); ax.set_ylabel("Temp (°C)")
+                ax.grid(True, linestyle='--', alpha=0.1)
+            else:
+                self.ax_artists[0].set_offsets(safe)
+                self.ax_artists[1].set_offsets(risk)
+                self.rescale_axes(safe, risk)
+            legend = ax.get_legend()
+            if legend is None:
+                ax.legend(facecolor=bg_color, edgecolor=text_color, labelcolor=text_color)
+            else:
+                # Both scatters persist, so the legend only needs recolouring
+                legend.get_frame().set_facecolor(bg_color)
+                legend.get_frame().set_edgecolor(text_color)
+                for text in legend.get_texts(): text.set_color(text_color)
 
         elif self.current_view == 'dist':
-            bench = self.analytics.get('peer_benchmarks', {})
+            bench = self.analytics.peer_benchmarks
             keys = [filter_type] if filter_type != "All Equipment" and filter_type in bench else list(bench.keys())
-            if keys:
-                mins = [bench[k]['flowrate_min'] for k in keys]
-                ranges = [bench[k]['flowrate_max'] - bench[k]['flowrate_min'] for k in keys]
-                ax.barh(keys, ranges, left=mins, height=0.5, color='#3B82F6')
-                ax.set_xlabel("Flowrate Range (m³/h)")
-                ax.grid(axis='x', linestyle='--', alpha=0.1)
+            mins = [bench[k]['flowrate_min'] for k in keys]
+            ranges = [bench[k]['flowrate_max'] - bench[k]['flowrate_min'] for k in keys]
+            if self.ax_artists is not None and self.ax_artists[0] == keys:
+                # Same categories: resize the existing bars in place
+                for bar, left, width in zip(self.ax_artists[1], mins, ranges):
+                    bar.set_x(left); bar.set_width(width)
+                ax.relim(); ax.autoscale_view()
+            else:
+                # The categorical y-axis remembers old categories, so a
+                # different set of keys needs a fresh Axes
+                if self.ax_artists is not None:
+                    ax.clear()
+                    self.style_axes(bg_color, text_color)
+                self.ax_artists = (keys, ax.barh(keys, ranges, left=mins, height=0.5, color='#3B82F6') if keys else [])
+                if keys:
+                    ax.set_xlabel("Flowrate Range (m³/h)")
+                    ax.grid(axis='x', linestyle='--', alpha=0.1)
 
         elif self.current_view == 'corr':
-            s = [d.get('r', 5) * 5 for d in data]
-            ax.scatter([d['x'] for d in data], [d['y'] for d in data], s=s, alpha=0.5, c='#6366F1', edgecolors='white', linewidth=0.5)
-            ax.set_xlabel("Pressure"); ax.set_ylabel("Temp")
-            ax.grid(True, linestyle='--', alpha=0.1)
+            xy = self.sc_xy[mask]
+            s = self.sc_sizes[mask]
+            if self.ax_artists is None:
+                self.ax_artists = ax.scatter(xy[:, 0], xy[:, 1], s=s, alpha=0.5, c='#6366F1', edgecolors='white', linewidth=0.5)
+                ax.set_xlabel("Pressure"); ax.set_ylabel("Temp")
+                ax.grid(True, linestyle='--', alpha=0.1)
+            else:
+                self.ax_artists.set_offsets(xy)
+                self.ax_artists.set_sizes(s)
+                self.rescale_axes(xy)
+
+        self.canvas.set_content(key)
+
+    def style_axes(self, bg_color, text_color):
+        ax = self.ax
+        ax.set_facecolor(bg_color)
+        ax.tick_params(colors=text_color, which='both')
+        for spine in ax.spines.values(): spine.set_color(text_color)
+        ax.xaxis.label.set_color(text_color); ax.yaxis.label.set_color(text_color)
+
+    @staticmethod
+    def xy_points(data):
+        return np.array([(d['x'], d['y']) for d in data], dtype=np.float64).reshape(-1, 2)
 
-        self.canvas.draw()
+    def rescale_axes(self, *point_sets):
+        # relim() ignores collections, so rebuild the data limits from the new offsets
+        ax = self.ax
+        ax.ignore_existing_data_limits = True
+        for points in point_sets:
+            if len(points):
+                ax.update_datalim(points)
+        ax.autoscale_view()
 
     def populate_sidebar(self):
         text_color = "white" if self.is_dark_mode else "#1E293B"
-        bg_color = "#1E293B" if self.is_dark_mode else "white"
         filter_type = self.filter_combo.currentText()
         
         if self.current_view == 'dist':
-            self.side_figure = Figure(figsize=(4, 4), dpi=100)
-            self.side_figure.patch.set_facecolor(bg_color)
-            self.side_canvas = FigureCanvas(self.side_figure)
-            self.side_content_area.addWidget(self.side_canvas)
-            ax = self.side_figure.add_subplot(111)
+            if self.pie_chart is None:
+                self.pie_chart = PieChart()
+            self.side_content_area.addWidget(self.pie_chart)
+            self.pie_chart.show()
             
-            dist = self.analytics.get('equipment_type_distribution', {})
-            labels = [filter_type] if filter_type != "All Equipment" and filter_type in dist else list(dist.keys())
-            values = [dist[filter_type]] if filter_type != "All Equipment" and filter_type in dist else list(dist.values())
+            key = (filter_type, self.is_dark_mode)
+            if key == self.pie_key:
+                return
+            self.pie_key = key
             
-            colors = ['#6366F1', '#3B82F6', '#10B981', '#F59E0B', '#EF4444']
-            wedges, texts, autotexts = ax.pie(values, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
-            for t in texts: t.set_color(text_color); t.set_fontsize(8)
-            for t in autotexts: t.set_color('white'); t.set_fontsize(8); t.set_weight('bold')
-            self.side_canvas.draw()
+            dist = self.analytics.equipment_type_distribution
+            labels = [filter_type] if filter_type != "All Equipment" and filter_type in dist else list(dist.keys())
+            values = np.fromiter(
+                (dist[k] for k in labels), dtype=np.float64, count=len(labels)
+            )
+            self.pie_chart.set_text_color(text_color)
+            self.pie_chart.set_data(labels, values)
             return
 
         if self.current_view == 'safety':
-            scroll = QScrollArea(); scroll.setWidgetResizable(True); scroll.setStyleSheet("border:none; background:transparent;")
-            content = QWidget(); content.setStyleSheet("background:transparent;")
-            layout = QVBoxLayout(content); layout.setContentsMargins(0,0,0,0)
-            scroll.setWidget(content)
-            self.side_content_area.addWidget(scroll)
-
-            all_outliers = self.analytics.get('outlier_equipment', [])
+            all_outliers = self.analytics.outlier_equipment
             outliers = [o for o in all_outliers if o['type'] == filter_type] if filter_type != "All Equipment" else all_outliers
 
             if not outliers:
-                lbl = QLabel("✅ All Systems Nominal"); lbl.setStyleSheet("color: #10B981; font-weight: bold;")
-                layout.addWidget(lbl)
-            else:
-                for out in outliers:
-                    w = QFrame()
-                    w.setStyleSheet(f"background: {'#450a0a' if self.is_dark_mode else '#FEF2F2'}; border-left: 3px solid #EF4444; border-radius: 4px;")
-                    l = QVBoxLayout(w); l.setContentsMargins(10,8,10,8); l.setSpacing(2)
-                    name = QLabel(out['name']); name.setStyleSheet(f"font-weight:bold; color: {'#F87171' if self.is_dark_mode else '#991B1B'}; border:none;")
-                    desc = QLabel("Parameter Excursion"); desc.setStyleSheet(f"color: {'#FECACA' if self.is_dark_mode else '#B91C1C'}; font-size:11px; border:none;")
-                    l.addWidget(name); l.addWidget(desc)
-                    layout.addWidget(w)
-            layout.addStretch()
+                lbl = QLabel("✅ All Systems Nominal"); lbl.setObjectName("nominalLabel")
+                self.side_content_area.addWidget(lbl, 0, Qt.AlignTop)
+                return
+            
+            # One list view over the names; cards are painted by the delegate,
+            # so no widgets are created per outlier
+            if self.outlier_view is None:
+                self.outlier_view = QListView()
+                self.outlier_view.setObjectName("outlierList")
+                self.outlier_view.setModel(QStringListModel(self.outlier_view))
+                self.outlier_view.setItemDelegate(OutlierDelegate(self.outlier_view))
+                self.outlier_view.setUniformItemSizes(True)
+                self.outlier_view.setResizeMode(QListView.Adjust)  # Cards follow the viewport width
+                self.outlier_view.setSpacing(3)
+                self.outlier_view.setSelectionMode(QAbstractItemView.NoSelection)
+                self.outlier_view.setFocusPolicy(Qt.NoFocus)
+                self.outlier_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+            self.outlier_view.itemDelegate().set_theme(self.is_dark_mode)
+            self.outlier_view.model().setStringList([o['name'] for o in outliers])
+            self.side_content_area.addWidget(self.outlier_view)
+            self.outlier_view.show()
             return
 
         if self.current_view == 'corr':
-            scroll = QScrollArea(); scroll.setWidgetResizable(True); scroll.setStyleSheet("border:none; background:transparent;")
-            content = QWidget(); content.setStyleSheet("background:transparent;")
+            scroll = QScrollArea(); scroll.setWidgetResizable(True); scroll.setObjectName("sideScroll")
+            content = QWidget(); content.setObjectName("sideList")
             layout = QVBoxLayout(content); layout.setContentsMargins(0,0,0,0)
-            scroll.setWidget(content)
-            self.side_content_area.addWidget(scroll)
 
-            matrix = self.analytics.get('correlation_matrix', [])
+            matrix = self.analytics.correlation_matrix
             for row in matrix:
                 lbl = QLabel(row['variable'].upper())
-                lbl.setStyleSheet(f"color: {text_color}; font-weight: bold; margin-top: 10px; border:none;")
+                lbl.setObjectName("corrLabel")
                 layout.addWidget(lbl)
                 
                 g = QFrame()
-                g.setStyleSheet("background: transparent; border: none;")
                 gl = QHBoxLayout(g); gl.setContentsMargins(0,0,0,0); gl.setSpacing(4)
                 
                 for k in ['flowrate', 'pressure', 'temperature']:
                     val = row.get(k, 0)
-                    bg = "#3B82F6" if abs(val) > 0.7 else ("#1E293B" if self.is_dark_mode else "#F1F5F9")
-                    fg = "white" if abs(val) > 0.7 else text_color
                     box = QLabel(f"{val:.2f}")
+                    box.setObjectName("corrCell")
+                    box.setProperty("strong", abs(val) > 0.7)
                     box.setAlignment(Qt.AlignCenter)
                     box.setFixedSize(60, 30)
-                    box.setStyleSheet(f"background: {bg}; color: {fg}; border-radius: 4px; font-size: 11px;")
                     gl.addWidget(box)
                 layout.addWidget(g)
             layout.addStretch()
+            scroll.setWidget(content)
+            self.side_content_area.addWidget(scroll)
 
 # Compatibility Alias
 DatasetDetailDialog = DatasetDetailWindow
\ No newline at end of file